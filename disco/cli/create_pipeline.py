@@ -163,6 +163,12 @@ def create_pipeline():
     show_default=True,
     help="Run in local mode (non-HPC)."
 )
+@click.option(
+    "--hpc-config",
+    type=click.Path(),
+    default=None,
+    help="HPC config file to set in all submitter params, created by 'jade config hpc'.",
+)
 def template(
     inputs,
     task_name,
@@ -182,11 +188,15 @@ def template(
     container,
     database,
     local,
+    hpc_config,
 ):
     """Create pipeline template file"""
     if hosting_capacity and impact_analysis:
         print("--impact-analysis and --hosting-capacity cannot both be enabled.")
         sys.exit(1)
+    if local and hpc_config is not None:
+        print("--local and --hpc-config cannot both be set.")
+        sys.exit(1)
     
     template = get_default_pipeline_template(simulation_type=simulation_type)
     template.data["task_name"] = task_name
@@ -276,10 +286,14 @@ def template(
     if local:
         for section in template.data.values():
             if isinstance(section, dict) and "submitter-params" in section:
-                hpc_config = HpcConfig(hpc_type="local", hpc=LocalHpcConfig())
-                section["submitter-params"]["hpc_config"] = hpc_config.dict()
-                type_val = hpc_config.hpc_type.value
+                local_config = HpcConfig(hpc_type="local", hpc=LocalHpcConfig())
+                section["submitter-params"]["hpc_config"] = local_config.dict()
+                type_val = local_config.hpc_type.value
                 section["submitter-params"]["hpc_config"]["hpc_type"] = type_val
+    elif hpc_config is not None:
+        for section in template.data.values():
+            if isinstance(section, dict) and "submitter-params" in section:
+                section["submitter-params"]["hpc_config"] = hpc_config
 
     dump_data(template.data, filename=template_file)
     print(f"Pipeline template file created - {template_file}")
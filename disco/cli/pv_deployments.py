@@ -7,16 +7,8 @@ from types import SimpleNamespace
 import click
 
 from jade.loggers import setup_logging
-from disco.enums import Placement
+from disco.enums import DeploymentCategory, DeploymentHierarchy, Placement
 from disco.sources.base import DEFAULT_PV_DEPLOYMENTS_DIRNAME
-from disco.sources.source_tree_1.pv_deployments import (
-    DeploymentHierarchy,
-    DeploymentCategory,
-    PVDataStorage,
-    PVDataManager,
-    PVDeploymentManager,
-    PVConfigManager
-)
 
 HIERARCHY_CHOICE = [item.value for item in DeploymentHierarchy]
 CATEGORY_CHOICE = [item.value for item in DeploymentCategory]
@@ -25,6 +17,12 @@ PLACEMENT_CHOICE = [item.value for item in Placement]
 logger = logging.getLogger(__name__)
 
 
+def _pv_deployments():
+    """Import the source tree 1 PV deployment module on first use."""
+    from disco.sources.source_tree_1 import pv_deployments as module
+    return module
+
+
 def create_pv_deployments(input_path: str, hierarchy: str, config: dict):
     """A method for generating pv deployments"""
     hierarchy = DeploymentHierarchy(hierarchy)
@@ -32,7 +30,7 @@ def create_pv_deployments(input_path: str, hierarchy: str, config: dict):
     if not config.placement:
         print(f"'-p' or '--placement' should not be None for this action, choose from {PLACEMENT_CHOICE}")
         sys.exit()
-    manager = PVDeploymentManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVDeploymentManager(input_path, hierarchy, config)
     summary = manager.generate_pv_deployments()
     print(json.dumps(summary, indent=2))
 
@@ -45,7 +43,7 @@ def create_pv_configs(input_path: str, hierarchy: str, config: dict):
         config.placement = None
         print(f"'-p' or '--placement' option is ignored for this action.")
     
-    manager = PVConfigManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVConfigManager(input_path, hierarchy, config)
     config_files = manager.generate_pv_configs()
     print(f"PV configs created! Total: {len(config_files)}")
 
@@ -54,7 +52,7 @@ def remove_pv_deployments(input_path: str, hierarchy: str, config: dict):
     """A method for removing deployed pv systems"""
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
-    manager = PVDeploymentManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVDeploymentManager(input_path, hierarchy, config)
     if config.placement:
         placement = Placement(config.placement)
     else:
@@ -66,7 +64,7 @@ def remove_pv_deployments(input_path: str, hierarchy: str, config: dict):
 def check_pv_deployments(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
-    manager = PVDeploymentManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVDeploymentManager(input_path, hierarchy, config)
     if config.placement:
         placement = Placement(config.placement)
     else:
@@ -78,7 +76,7 @@ def check_pv_deployments(input_path: str, hierarchy: str, config: dict):
 def remove_pv_configs(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
-    manager = PVConfigManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVConfigManager(input_path, hierarchy, config)
     if config.placement:
         placement = Placement(config.placement)
     else:
@@ -90,7 +88,7 @@ def remove_pv_configs(input_path: str, hierarchy: str, config: dict):
 def check_pv_configs(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
-    manager = PVConfigManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVConfigManager(input_path, hierarchy, config)
     if config.placement:
         placement = Placement(config.placement)
     else:
@@ -101,7 +99,7 @@ def check_pv_configs(input_path: str, hierarchy: str, config: dict):
 
 def list_feeder_paths(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
-    storage = PVDataStorage(input_path, hierarchy, config)
+    storage = _pv_deployments().PVDataStorage(input_path, hierarchy, config)
     result = storage.get_feeder_paths()
     for feeder_path in result:
         print(feeder_path)
@@ -111,7 +109,7 @@ def list_feeder_paths(input_path: str, hierarchy: str, config: dict):
 def redirect_pv_shapes(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
-    manager = PVDataManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVDataManager(input_path, hierarchy, config)
     manager.redirect_substation_pv_shapes()
     manager.redirect_feeder_pv_shapes()
 
@@ -120,24 +118,24 @@ def generate_pv_deployment_jobs(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
     
-    manager = PVDeploymentManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVDeploymentManager(input_path, hierarchy, config)
     manager.generate_pv_creation_jobs()
     
-    manager = PVConfigManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVConfigManager(input_path, hierarchy, config)
     manager.generate_pv_config_jobs()
 
 
 def restore_feeder_data(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
-    manager = PVDataManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVDataManager(input_path, hierarchy, config)
     manager.restore_feeder_data()
 
 
 def transform_feeder_loads(input_path: str, hierarchy: str, config: dict):
     hierarchy = DeploymentHierarchy(hierarchy)
     config = SimpleNamespace(**config)
-    manager = PVDataManager(input_path, hierarchy, config)
+    manager = _pv_deployments().PVDataManager(input_path, hierarchy, config)
     manager.transform_feeder_loads()
 
 
@@ -75,6 +75,21 @@ def get_placement_from_value(value):
     raise Exception("Unknown value: {}".format(value))
 
 
+class DeploymentHierarchy(enum.Enum):
+    """Possible values for PV deployment hierarchy"""
+    FEEDER = "feeder"
+    SUBSTATION = "substation"
+    REGION = "region"
+    CITY = "city"
+
+
+class DeploymentCategory(enum.Enum):
+    """Possible values for PV deployment category"""
+    MIXED = "mixed"
+    SMALL = "small"
+    LARGE = "large"
+
+
 class Mode(enum.Enum):
     """Possible values for computational sequencing mode"""
     PARALLEL = "parallel"
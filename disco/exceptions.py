@@ -126,6 +126,18 @@ EXCEPTIONS_TO_ERROR_CODES = {
     },
 }
 
+_ERROR_CODES_TO_EXCEPTIONS = {v["error_code"]: k for k, v in EXCEPTIONS_TO_ERROR_CODES.items()}
+
+_CONVERGENCE_ERROR_CODES = frozenset(
+    EXCEPTIONS_TO_ERROR_CODES[x]["error_code"]
+    for x in (
+        OpenDssConvergenceError,
+        PyDssConvergenceError,
+        PyDssConvergenceErrorCountExceeded,
+        PyDssConvergenceMaxError,
+    )
+)
+
 
 def get_error_code_from_exception(exception_class):
     """Return the error code for a disco exception."""
@@ -141,4 +153,4 @@ def get_error_code_from_exception(exception_class):
 
 def is_convergence_error(error_code):
     """Return True if the error code indicates a convergence error."""
-    return error_code in {119, 120, 121, 122}
+    return error_code in _CONVERGENCE_ERROR_CODES
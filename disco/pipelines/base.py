@@ -1,6 +1,12 @@
+import copy
+import functools
+import hashlib
 import logging
 import os
+import pickle
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from jade.hpc.common import HpcType
 from jade.jobs.pipeline_manager import PipelineManager
@@ -12,13 +18,93 @@ from disco.enums import AnalysisType
 
 logger = logging.getLogger(__name__)
 
+AUTO_CONFIG_PYTHON_FILE = os.path.join(os.path.dirname(__file__), "auto_config.py")
+PRESCREEN_AUTO_CONFIG_TEXT_FILE = os.path.join(".", "pipeline-prescreen-auto-config.txt")
+SIMULATION_AUTO_CONFIG_TEXT_FILE = os.path.join(".", "pipeline-simulation-auto-config.txt")
+POSTPROCESS_AUTO_CONFIG_TEXT_FILE = os.path.join(".", "pipeline-postprocess-auto-config.txt")
+POSTPROCESS_COMMAND_TEXT_FILE = os.path.join(".", "pipeline-postprocess-command.txt")
+
+
+TEMPLATE_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "disco" / "pipeline-templates"
+)
+# Set this environment variable to a non-empty value to disable the on-disk cache.
+TEMPLATE_CACHE_DISABLE_ENV = "DISCO_NO_TEMPLATE_CACHE"
+MAX_TEMPLATE_CACHE_FILES = 64
+
+# Templates shipped with the package are small and are not written to the cache.
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _use_template_cache(template_file):
+    if os.environ.get(TEMPLATE_CACHE_DISABLE_ENV):
+        return False
+    return not template_file.startswith(_PACKAGE_DIR + os.sep)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_template_data(template_file, digest):
+    # The content digest is part of the cache key so that edited files get reloaded.
+    # mtime and size are not enough on filesystems with coarse timestamps.
+    if not _use_template_cache(template_file):
+        return load_data(template_file)
+
+    key = hashlib.blake2b(template_file.encode(), digest_size=8).hexdigest()
+    cache_file = TEMPLATE_CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+        if cached["digest"] == digest:
+            return cached["data"]
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Unpickling can fail in many ways, e.g., a pickle protocol written by a
+        # newer Python version. The cache is optional, so parse the file instead.
+        logger.debug("Ignoring invalid template cache file %s", cache_file, exc_info=True)
+
+    data = load_data(template_file)
+    try:
+        TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump({"digest": digest, "data": data}, f)
+        os.replace(tmp_file, cache_file)
+        _prune_template_cache()
+    except OSError:
+        logger.debug("Failed to write the template cache file %s", cache_file, exc_info=True)
+    return data
+
+
+def _prune_template_cache():
+    """Delete the least recently written cache files beyond MAX_TEMPLATE_CACHE_FILES."""
+    entries = [x for x in os.scandir(TEMPLATE_CACHE_DIR) if x.name.endswith(".pkl")]
+    if len(entries) <= MAX_TEMPLATE_CACHE_FILES:
+        return
+    entries.sort(key=lambda x: x.stat().st_mtime_ns)
+    for entry in entries[:len(entries) - MAX_TEMPLATE_CACHE_FILES]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def load_template_data(template_file):
+    """Return a copy of the template data, parsing the file only when it changes."""
+    with open(template_file, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    data = _load_template_data(os.path.abspath(template_file), digest)
+    return copy.deepcopy(data)
+
 
 class PipelineTemplate:
     """class for handling pipeline template data"""
+
+    __slots__ = ("template_file", "data")
     
     def __init__(self, template_file):
         self.template_file = template_file
-        self.data = load_data(template_file)
+        self.data = load_template_data(template_file)
     
     @property
     def task_name(self):
@@ -89,11 +175,10 @@ class PipelineTemplate:
         if params_type not in self.data[section]:
             raise KeyError(f"Template section '{section}' does not contain '{params_type}'.")
         
-        params = self.data[section].get(params_type)
-        for param, value in params.items():
-            if value == "null":
-                params[param] = None
-        return params
+        # Template files store None as "null". Convert on a copy so that self.data
+        # can still be dumped to TOML without dropping those params.
+        params = self.data[section][params_type]
+        return {k: None if v == "null" else v for k, v in params.items()}
 
     def get_transform_params(self, section):
         return self.get_command_params(section, TemplateParams.TRANSFORM_PARAMS)
@@ -120,28 +205,20 @@ class PipelineTemplate:
     
     @staticmethod
     def _construct_options_string(params):
-        temp = []
-        for param, value in params.items():
-            if value == "null" or value is False or value is None:
-                continue
-            dash_param = "--" + param.replace("_", "-")
-            if value is True:
-                temp.append(dash_param)
-            else:
-                temp.append(f"{dash_param}={value}")
-        options =  " ".join(temp)
-        return options
+        return " ".join(
+            _format_option(param, value)
+            for param, value in params.items()
+            if not (value is None or value is False or value == "null")
+        )
     
     def get_model_transform_output(self):
-        if "JADE_PIPELINE_OUTPUT_DIR" in os.environ:
-            pipeline_output = os.environ["JADE_PIPELINE_OUTPUT_DIR"]
-        else:
-            pipeline_output = "$JADE_PIPELINE_OUTPUT_DIR"
+        pipeline_output = os.environ.get("JADE_PIPELINE_OUTPUT_DIR", "$JADE_PIPELINE_OUTPUT_DIR")
         params = self.get_transform_params(TemplateSection.MODEL)
         output = os.path.join(pipeline_output, params["output"])
         return output
     
     def get_transform_options(self, section):
+        # get_transform_params returns a copy, so this does not modify the template.
         params = self.get_transform_params(TemplateSection.MODEL)
         params["output"] = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", params["output"])
         options = self._construct_options_string(params)
@@ -175,33 +252,57 @@ class PipelineTemplate:
 class PipelineCreatorBase(ABC):
     """A base class for pipeline creator"""
 
+    __slots__ = ("template_file", "_template")
+
     def __init__(self, template_file):
         self.template_file = template_file
-        self.stage_num = 0
+        self._template = PipelineTemplate(template_file)
     
     @property
     def template(self):
-        return PipelineTemplate(self.template_file)
+        return self._template
     
     @staticmethod
     def get_auto_config_python_file():
-        return os.path.join(os.path.dirname(__file__), "auto_config.py")
+        return AUTO_CONFIG_PYTHON_FILE
     
     def get_prescreen_auto_config_text_file(self):
-        return os.path.join(".", "pipeline-prescreen-auto-config.txt")
+        return PRESCREEN_AUTO_CONFIG_TEXT_FILE
     
     def get_simulation_auto_config_text_file(self):
-        return os.path.join(".", "pipeline-simulation-auto-config.txt")
+        return SIMULATION_AUTO_CONFIG_TEXT_FILE
 
     def get_postprocess_auto_config_text_file(self):
-        return os.path.join(".", "pipeline-postprocess-auto-config.txt")
+        return POSTPROCESS_AUTO_CONFIG_TEXT_FILE
     
     def get_postprocess_command_text_file(self):
-        return os.path.join(".", "pipeline-postprocess-command.txt")
+        return POSTPROCESS_COMMAND_TEXT_FILE
     
     @abstractmethod
     def create_pipeline(self, pipeline_config_file):
         """Create pipeline config file"""
+
+    def make_stages(self, stage_builders):
+        """Make pipeline stages, numbered in the order of stage_builders.
+
+        Parameters
+        ----------
+        stage_builders : list
+            methods that accept a stage number and return a PipelineStage
+
+        Returns
+        -------
+        list
+
+        """
+        # Each builder only reads the template and writes its own files, so they
+        # can overlap their file I/O.
+        with ThreadPoolExecutor(max_workers=max(len(stage_builders), 1)) as executor:
+            futures = [
+                executor.submit(make_stage, stage_num)
+                for stage_num, make_stage in enumerate(stage_builders, start=1)
+            ]
+            return [future.result() for future in futures]
     
     @abstractmethod
     def make_model_transform_command(self):
@@ -212,71 +313,60 @@ class PipelineCreatorBase(ABC):
         """Make disco prescreen-pv-penetration-levels command"""
     
     @abstractmethod
-    def make_prescreen_filter_command(self):
-        """Make disco prescreen-pv-penetration-levels filter-config command"""
+    def make_prescreen_filter_command(self, stage_num):
+        """Make disco prescreen-pv-penetration-levels filter-config command for the stage
+        following the prescreen stage"""
     
     @abstractmethod
     def make_disco_config_command(self, section):
         """Make disco config command"""
     
     @abstractmethod
-    def make_postprocess_command(self):
-        """Make disco make-summary-tables & compute-hosting-capacity command"""
+    def make_postprocess_command(self, stage_num):
+        """Make disco make-summary-tables & compute-hosting-capacity command for the
+        postprocess stage"""
     
     def create_prescreen_auto_config_text_file(self):
         """Create script for generating prescreen config file"""
-        temp = []
-        if not self.template.preconfigured:
-            transform_command = self.make_model_transform_command()
-            temp.append(transform_command)
+        transform = "" if self.template.preconfigured else self.make_model_transform_command() + "\n"
         config_command = self.make_disco_config_command(TemplateSection.PRESCREEN)
         prescreen_command = self.make_prescreen_create_command()
-        temp.extend([config_command, prescreen_command])
-        auto_config_command = "\n".join(temp)
+        auto_config_command = f"{transform}{config_command}\n{prescreen_command}"
         
         text_file = self.get_prescreen_auto_config_text_file()
-        with open(text_file, "w") as f:
-            f.write(auto_config_command)
-            f.write("\n")
+        _write_text_file(text_file, auto_config_command + "\n")
         return text_file
     
-    def create_simulation_auto_config_text_file(self):
+    def create_simulation_auto_config_text_file(self, stage_num):
         """Create script for generating disco config file"""
         if self.template.contains_prescreen():
-            auto_config_command = self.make_prescreen_filter_command()
+            auto_config_command = self.make_prescreen_filter_command(stage_num)
         else:
-            temp = []
-            if not self.template.preconfigured:
-                temp.append(self.make_model_transform_command())
-            temp.append(self.make_disco_config_command(TemplateSection.SIMULATION))
-            auto_config_command = "\n".join(temp)
+            transform = "" if self.template.preconfigured else self.make_model_transform_command() + "\n"
+            config_command = self.make_disco_config_command(TemplateSection.SIMULATION)
+            auto_config_command = f"{transform}{config_command}"
         
         text_file = self.get_simulation_auto_config_text_file()
-        with open(text_file, "w") as f:
-            f.write(auto_config_command)
-            f.write("\n")
+        _write_text_file(text_file, auto_config_command + "\n")
         return text_file
 
-    def create_postprocess_auto_config_text_file(self):
+    def create_postprocess_auto_config_text_file(self, stage_num):
         """Create script for generating postprocess config file"""
-        command_file = self.create_postprocess_command_text_file()
+        command_file = self.create_postprocess_command_text_file(stage_num)
         options = self.template.get_config_options(TemplateSection.POSTPROCESS)
         auto_config_command = f"jade config create {command_file} {options}"
         
         text_file = self.get_postprocess_auto_config_text_file()
-        with open(text_file, "w") as f:
-            f.write(auto_config_command)
+        _write_text_file(text_file, auto_config_command)
         return text_file
     
-    def create_postprocess_command_text_file(self):
-        text_file = "pipeline-postprocess-command.txt"
-        command = self.make_postprocess_command()
-        with open(text_file, "w") as f:
-            f.write(command)
+    def create_postprocess_command_text_file(self, stage_num):
+        text_file = self.get_postprocess_command_text_file()
+        command = self.make_postprocess_command(stage_num)
+        _write_text_file(text_file, command)
         return text_file
 
-    def make_prescreen_stage(self):
-        self.stage_num += 1
+    def make_prescreen_stage(self, stage_num):
         auto_config_text_file = self.create_prescreen_auto_config_text_file()
         submitter_params = self.template.get_submitter_params(TemplateSection.PRESCREEN)
         submitter_params["hpc_config"] = _create_hpc_config(submitter_params)
@@ -287,14 +377,13 @@ class PipelineCreatorBase(ABC):
         stage = PipelineStage(
             auto_config_cmd=auto_config_command,
             config_file=prescreen_params["prescreen_config_file"],
-            stage_num=self.stage_num,
+            stage_num=stage_num,
             submitter_params=submitter_params,
         )
         return stage
 
-    def make_simulation_stage(self):
-        self.stage_num += 1
-        auto_config_text_file = self.create_simulation_auto_config_text_file()
+    def make_simulation_stage(self, stage_num):
+        auto_config_text_file = self.create_simulation_auto_config_text_file(stage_num)
         submitter_params = self.template.get_submitter_params(TemplateSection.SIMULATION)
         submitter_params["hpc_config"] = _create_hpc_config(submitter_params)
         
@@ -310,14 +399,13 @@ class PipelineCreatorBase(ABC):
         stage = PipelineStage(
             auto_config_cmd=auto_config_command,
             config_file=config_file,
-            stage_num=self.stage_num,
+            stage_num=stage_num,
             submitter_params=submitter_params
         )
         return stage
     
-    def make_postprocess_stage(self):
-        self.stage_num += 1
-        auto_config_text_file = self.create_postprocess_auto_config_text_file()
+    def make_postprocess_stage(self, stage_num):
+        auto_config_text_file = self.create_postprocess_auto_config_text_file(stage_num)
         submitter_params = self.template.get_submitter_params(TemplateSection.POSTPROCESS)
         submitter_params["hpc_config"] = _create_hpc_config(submitter_params)
         
@@ -327,17 +415,57 @@ class PipelineCreatorBase(ABC):
         stage = PipelineStage(
             auto_config_cmd=auto_config_command,
             config_file=config_params["config_file"],
-            stage_num=self.stage_num,
+            stage_num=stage_num,
             submitter_params=submitter_params
         )
         return stage
 
 
+@functools.lru_cache(maxsize=None)
+def _make_dash_param(param):
+    # Template params come from a small, fixed set of names.
+    return "--" + param.replace("_", "-")
+
+
+def _format_option(param, value):
+    dash_param = _make_dash_param(param)
+    if value is True:
+        return dash_param
+    return f"{dash_param}={value}"
+
+
+def _write_text_file(filename, text):
+    """Write a small text file with one unbuffered write."""
+    data = text.encode("utf-8")
+    # 0o666 matches open(filename, "w"); the process umask still applies.
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_hpc_config_cached(hpc_config_file, mtime_ns, size):
+    return HpcConfig(**load_data(hpc_config_file))
+
+
+def _load_hpc_config(hpc_config_file):
+    # All stages usually share one HPC config file; parse and validate it once.
+    stat = os.stat(hpc_config_file)
+    hpc_config = _load_hpc_config_cached(
+        os.path.abspath(hpc_config_file), stat.st_mtime_ns, stat.st_size
+    )
+    return hpc_config.copy(deep=True)
+
+
 def _create_hpc_config(submitter_params):
     # TODO: this should be solved in JADE.
     hpc_config = submitter_params["hpc_config"]
     if isinstance(hpc_config, str):
-        return HpcConfig(**load_data(hpc_config))
+        return _load_hpc_config(hpc_config)
 
     if submitter_params["hpc_config"]["hpc_type"] == "local":
         return HpcConfig(hpc_type=HpcType.LOCAL, hpc=LocalHpcConfig())
@@ -18,11 +18,14 @@ logger = logging.getLogger(__name__)
 
 class SnapshotPipelineCreator(PipelineCreatorBase):
 
+    __slots__ = ()
+
     def create_pipeline(self, config_file):
         """Make snapshot pipeline config file"""
-        stages = [self.make_simulation_stage()]
+        stage_builders = [self.make_simulation_stage]
         if self.template.contains_postprocess():
-            stages.append(self.make_postprocess_stage())
+            stage_builders.append(self.make_postprocess_stage)
+        stages = self.make_stages(stage_builders)
 
         config = PipelineConfig(stages=stages, stage_num=1)
         with open(config_file, "w") as f:
@@ -56,16 +59,16 @@ class SnapshotPipelineCreator(PipelineCreatorBase):
     def make_prescreen_create_command(self):
         pass
 
-    def make_prescreen_filter_command(self):
+    def make_prescreen_filter_command(self, stage_num):
         pass
 
-    def make_postprocess_command(self):
+    def make_postprocess_command(self, stage_num):
         commands = []
         impact_analysis = self.template.analysis_type == AnalysisType.IMPACT_ANALYSIS.value
         hosting_capacity = self.template.analysis_type == AnalysisType.HOSTING_CAPACITY.value
         if impact_analysis or hosting_capacity:
             # Postprocess to make summary tables
-            inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{self.stage_num-1}")
+            inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{stage_num-1}")
             commands.append(f"disco make-summary-tables {inputs}")
             
             # Postprocess to compute hosting capacity
@@ -117,14 +120,17 @@ class SnapshotPipelineCreator(PipelineCreatorBase):
 class TimeSeriesPipelineCreator(PipelineCreatorBase):
     """Time-series pipeline creator class"""
 
+    __slots__ = ()
+
     def create_pipeline(self, config_file):
         """Make time-series pipeline config file"""
-        stages = []
+        stage_builders = []
         if self.template.contains_prescreen():
-            stages.append(self.make_prescreen_stage())
-        stages.append(self.make_simulation_stage())
+            stage_builders.append(self.make_prescreen_stage)
+        stage_builders.append(self.make_simulation_stage)
         if self.template.contains_postprocess():
-            stages.append(self.make_postprocess_stage())
+            stage_builders.append(self.make_postprocess_stage)
+        stages = self.make_stages(stage_builders)
 
         config = PipelineConfig(stages=stages, stage_num=1)
         with open(config_file, "w") as f:
@@ -167,12 +173,12 @@ class TimeSeriesPipelineCreator(PipelineCreatorBase):
         logger.info("Make command - '%s'", command)
         return command
 
-    def make_prescreen_filter_command(self):
+    def make_prescreen_filter_command(self, stage_num):
         config_params = self.template.get_config_params(TemplateSection.PRESCREEN)
         config_file = config_params["config_file"]
 
         prescreen_params = self.template.get_prescreen_params(TemplateSection.PRESCREEN)
-        prescreen_output = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{self.stage_num-1}")
+        prescreen_output = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{stage_num-1}")
         command = (
             f"disco prescreen-pv-penetration-levels {config_file} "
             f"filter-config {prescreen_output} "
@@ -181,12 +187,12 @@ class TimeSeriesPipelineCreator(PipelineCreatorBase):
         logger.info("Make command - '%s'", command)
         return command
 
-    def make_postprocess_command(self):
+    def make_postprocess_command(self, stage_num):
         commands = []
         impact_analysis = self.template.analysis_type == AnalysisType.IMPACT_ANALYSIS.value
         hosting_capacity = self.template.analysis_type == AnalysisType.HOSTING_CAPACITY.value
         if impact_analysis or hosting_capacity:
-            inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{self.stage_num-1}")
+            inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{stage_num-1}")
             commands.append(f"disco make-summary-tables {inputs}")
             if hosting_capacity:
                 for scenario in TIME_SERIES_SCENARIOS:
@@ -212,7 +218,7 @@ class TimeSeriesPipelineCreator(PipelineCreatorBase):
             )
 
         elif self.template.analysis_type == AnalysisType.COST_BENEFIT.value:
-            inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{self.stage_num-1}")
+            inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{stage_num-1}")
             commands.append(f"disco-internal make-cba-tables {inputs}")
         
         return "\n".join(commands)
@@ -221,10 +227,13 @@ class TimeSeriesPipelineCreator(PipelineCreatorBase):
 class UpgradePipelineCreator(PipelineCreatorBase):
     """Upgrade pipeline creator class"""
 
+    __slots__ = ()
+
     def create_pipeline(self, config_file):
-        stages = [self.make_simulation_stage()]
+        stage_builders = [self.make_simulation_stage]
         if self.template.contains_postprocess():
-            stages.append(self.make_postprocess_stage())
+            stage_builders.append(self.make_postprocess_stage)
+        stages = self.make_stages(stage_builders)
         
         config = PipelineConfig(stages=stages, stage_num=1)
         with open(config_file, "w") as f:
@@ -240,7 +249,7 @@ class UpgradePipelineCreator(PipelineCreatorBase):
     def make_prescreen_create_command(self):
         pass
 
-    def make_prescreen_filter_command(self):
+    def make_prescreen_filter_command(self, stage_num):
         pass
 
     def make_disco_config_command(self, section):
@@ -254,8 +263,8 @@ class UpgradePipelineCreator(PipelineCreatorBase):
         logger.info("Make command - '%s'", command)
         return command
 
-    def make_postprocess_command(self):
-        inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{self.stage_num-1}")
+    def make_postprocess_command(self, stage_num):
+        inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{stage_num-1}")
         command = f"disco-internal make-upgrade-tables {inputs}"
         return command
 
@@ -263,10 +272,13 @@ class UpgradePipelineCreator(PipelineCreatorBase):
 class UpgradePipelineCreator(PipelineCreatorBase):
     """Upgrade pipeline creator class"""
 
+    __slots__ = ()
+
     def create_pipeline(self, config_file):
-        stages = [self.make_simulation_stage()]
+        stage_builders = [self.make_simulation_stage]
         if self.template.contains_postprocess():
-            stages.append(self.make_postprocess_stage())
+            stage_builders.append(self.make_postprocess_stage)
+        stages = self.make_stages(stage_builders)
         
         config = PipelineConfig(stages=stages, stage_num=1)
         with open(config_file, "w") as f:
@@ -282,7 +294,7 @@ class UpgradePipelineCreator(PipelineCreatorBase):
     def make_prescreen_create_command(self):
         pass
 
-    def make_prescreen_filter_command(self):
+    def make_prescreen_filter_command(self, stage_num):
         pass
 
     def make_disco_config_command(self, section):
@@ -296,7 +308,7 @@ class UpgradePipelineCreator(PipelineCreatorBase):
         logger.info("Make command - '%s'", command)
         return command
 
-    def make_postprocess_command(self):
-        inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{self.stage_num-1}")
+    def make_postprocess_command(self, stage_num):
+        inputs = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", f"output-stage{stage_num-1}")
         command = f"disco-internal make-upgrade-tables {inputs}"
         return command
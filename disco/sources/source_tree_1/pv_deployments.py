@@ -1,5 +1,4 @@
 import abc
-import enum
 import json
 import logging
 import os
@@ -21,7 +20,7 @@ from filelock import SoftFileLock
 from jade.utils.run_command import check_run_command
 from jade.utils.utils import load_data, dump_data
 from disco.common import LOADS_SUM_GROUP_FILENAME, PV_SYSTEMS_SUM_GROUP_FILENAME
-from disco.enums import Placement
+from disco.enums import DeploymentCategory, DeploymentHierarchy, Placement
 
 logger = logging.getLogger(__name__)
 
@@ -39,19 +38,6 @@ LOADSHAPES_FILENAME = "LoadShapes.dss"
 ORGINAL_LOADSHAPES_FILENAME = "Original_LoadShapes.dss"
 
 
-class DeploymentHierarchy(enum.Enum):
-    FEEDER = "feeder"
-    SUBSTATION = "substation"
-    REGION = "region"
-    CITY = "city"
-
-
-class DeploymentCategory(enum.Enum):
-    MIXED = "mixed"
-    SMALL = "small"
-    LARGE = "large"
-
-
 def get_subdir_names(input_path: str) -> list:
     """Given an input path, return directory names under the path.
     Used to parse substation names, and feeder names under input path.
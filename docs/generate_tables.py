@@ -1,3 +1,4 @@
+import csv
 from pathlib import Path
 
 import click
@@ -14,24 +15,24 @@ def generate_tables(output_dir):
 
 def generate_return_codes(output_dir):
     output_file = output_dir / "return_codes.csv"
-    with open(output_file, "w") as f_out:
-        header = "Return Code,Description,Corrective Action"
-        f_out.write("\t".join(header) + "\n")
-        f_out.write("0,Success,\n")
-        f_out.write("1,Generic error,\n")
-        for item in EXCEPTIONS_TO_ERROR_CODES.values():
-            f_out.write(str(item["error_code"]))
-            f_out.write(",")
-            f_out.write('"')
-            f_out.write(item["description"])
-            f_out.write('"')
-            if item.get("corrective_action"):
-                f_out.write(",")
-                f_out.write('"')
-                f_out.write(item["corrective_action"])
-                f_out.write('"')
-            f_out.write("\n")
-    
+    fieldnames = ["Return Code", "Description", "Corrective Action"]
+    rows = [
+        {"Return Code": 0, "Description": "Success", "Corrective Action": ""},
+        {"Return Code": 1, "Description": "Generic error", "Corrective Action": ""},
+    ]
+    rows += [
+        {
+            "Return Code": item["error_code"],
+            "Description": item["description"],
+            "Corrective Action": item.get("corrective_action", ""),
+        }
+        for item in sorted(EXCEPTIONS_TO_ERROR_CODES.values(), key=lambda x: x["error_code"])
+    ]
+    with open(output_file, "w", newline="") as f_out:
+        writer = csv.DictWriter(f_out, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
+        writer.writeheader()
+        writer.writerows(rows)
+
 
 if __name__ == "__main__":
     generate_tables()
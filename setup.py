@@ -84,6 +84,7 @@ dev_requires = [
     "pylint",
     "pytest",
     "pytest-cov",
+    "pytest-xdist",
     "sphinx>=2.0",
     "sphinx-rtd-theme>=0.4.3",
     "sphinxcontrib-plantuml",
@@ -3,26 +3,31 @@ import os
 import shutil
 import pytest
 
+from jade.utils.subprocess_manager import run_command
+
 
 from tests.common import *
 
 
+RESULT_FILES = frozenset((
+    PIPELINE_CONFIG,
+    CONFIG_FILE,
+    PRESCREEN_CONFIG_FILE,
+    PRESCREEN_FINAL_CONFIG_FILE,
+    TRANSFORM_MODEL_LOG,
+    UPGRADE_SUMMARY,
+))
+RESULT_DIRS = frozenset((OUTPUT, MODELS_DIR))
+
+
 @pytest.fixture
 def cleanup():
     def delete_files():
-        for path in (
-            PIPELINE_CONFIG,
-            CONFIG_FILE,
-            PRESCREEN_CONFIG_FILE,
-            PRESCREEN_FINAL_CONFIG_FILE,
-            TRANSFORM_MODEL_LOG,
-            UPGRADE_SUMMARY
-        ):
-            if os.path.exists(path):
-                os.remove(path)
-        for path in (OUTPUT, MODELS_DIR):
-            if os.path.exists(path):
-                shutil.rmtree(path)
+        entries = set(os.listdir("."))
+        for path in entries & RESULT_FILES:
+            os.remove(path)
+        for path in entries & RESULT_DIRS:
+            shutil.rmtree(path)
 
     delete_files()
     yield
@@ -35,9 +40,18 @@ def test_data_dir():
     return os.path.join(os.path.dirname(__file__), "data")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def smart_ds_substations():
     """The path to the tests data - smart-ds substations"""
     return os.path.join(
         os.path.dirname(__file__), "data", "smart-ds", "substations"
     )
+
+
+@pytest.fixture(scope="session")
+def preconfigured_snapshot_models(tmp_path_factory, smart_ds_substations):
+    """The path to snapshot models transformed once from smart-ds substations"""
+    path = tmp_path_factory.mktemp("preconfigured") / "snapshot-models"
+    ret = run_command(f"disco transform-model {smart_ds_substations} snapshot -o {path}")
+    assert ret == 0
+    return str(path)
@@ -1,13 +1,20 @@
 import os
-import shutil
+import shlex
 
 import pytest
 
+from click.testing import CliRunner
 from jade.utils.subprocess_manager import run_command
-from jade.utils.utils import load_data, dump_data
+from jade.utils.utils import load_data
 
 from PyDSS.common import SnapshotTimePointSelectionMode
 
+from disco.cli.create_pipeline import (
+    config as create_pipeline_config_cmd,
+    template as create_pipeline_template_cmd,
+)
+from disco.pipelines.base import TEMPLATE_CACHE_DISABLE_ENV
+
 # Pre-defined filenames
 TEST_TEMPLATE_FILE = "pipeline-test-template.toml"
 TEST_PIPELINE_CONFIG_FILE = "pipeline-test.json"
@@ -18,15 +25,9 @@ POSTPROCESS_AUTO_CONFIG_TEXT_FILE = "pipeline-postprocess-auto-config.txt"
 POSTPROCESS_COMMAND_TEXT_FILE = "pipeline-postprocess-command.txt"
 
 # Output filenames/dir after pipeline submit
-TRANSFORM_MODEL_LOG_FILE = "transform_model.log"
-SIMULATION_CONFIG_FILE = "config.json"
-PRESCREEN_CONFIG_FILE = "prescreen-config.json"
-FILTERED_CONFIG_FILE = "filtered-config.json"
-POSTPROCESS_CONFIG_FILE = "postprocess-config.json"
 SNAPSHOT_MODELS_DIR = "snapshot-models"
 TIME_SERIES_MODELS_DIR = "time-series-models"
 TEST_PIPELINE_OUTPUT = "pipeline-test-output"
-TEST_PRECONFIGURED_MODELS = "test-preconfigured-models"
 
 FEEDER_HEAD_TABLE = "feeder_head_table.csv"
 FEEDER_LOSSES_TABLE = "feeder_losses_table.csv"
@@ -39,149 +40,122 @@ POWERS_TABLE = "powers_table.csv"
 LOAD_TYPES_TABLE = "load_customer_types.csv"
 PV_SYSTEM_TYPES_TABLE = "pv_system_customer_types.csv"
 
-SNAPSHOT_REPORTS_FILE = "generated_snapshot_reports.toml"
-TIME_SERIES_REPORTS_FILE = "generated_time_series_reports.toml"
-
 SCENARIO_HOSTING_CAPACITY_SUMMARY_FILE = "hosting_capacity_summary__control_mode.json"
 SCENARIO_HOSTING_CAPACITY_OVERALL_FILE = "hosting_capacity_overall__control_mode.json"
 
-
-CONFIG_HPC_COMMAND = (
-    f"jade config hpc -a testaccount -p short -t local -w 4:00 "
-    f"-c {TEST_HPC_CONFIG_FILE}"
+_HC_MODES = tuple(
+    x.value for x in SnapshotTimePointSelectionMode if x != SnapshotTimePointSelectionMode.NONE
 )
-MAKE_PIPELINE_CONFIG_COMMAND = (
-    f"disco create-pipeline config {TEST_TEMPLATE_FILE} "
-    F"-c {TEST_PIPELINE_CONFIG_FILE}"
+_HC_EXPECTED = tuple(
+    filename.replace(".json", f"__{mode}.json")
+    for mode in _HC_MODES
+    for filename in (SCENARIO_HOSTING_CAPACITY_OVERALL_FILE, SCENARIO_HOSTING_CAPACITY_SUMMARY_FILE)
 )
 
 
-@pytest.fixture
-def cleanup():
-    """clean up all filenames and dirs generated during tests"""
-    def delete_test_results():
-        result_files = [
-            TEST_TEMPLATE_FILE,
-            TEST_PIPELINE_CONFIG_FILE,
-            TEST_HPC_CONFIG_FILE,
-            PRESCREEN_AUTO_CONFIG_TEXT_FILE,
-            SIMULATION_AUTO_CONFIG_TEXT_FILE,
-            POSTPROCESS_AUTO_CONFIG_TEXT_FILE,
-            POSTPROCESS_COMMAND_TEXT_FILE,
-            TRANSFORM_MODEL_LOG_FILE,
-            SIMULATION_CONFIG_FILE,
-            PRESCREEN_CONFIG_FILE,
-            FILTERED_CONFIG_FILE,
-            POSTPROCESS_CONFIG_FILE,
-            SNAPSHOT_REPORTS_FILE,
-            TIME_SERIES_REPORTS_FILE,
-            SCENARIO_HOSTING_CAPACITY_SUMMARY_FILE,
-            SCENARIO_HOSTING_CAPACITY_OVERALL_FILE
-        ]
-        for path in result_files:
-            if os.path.exists(path):
-                os.remove(path)
-
-        result_dirs = [
-            SNAPSHOT_MODELS_DIR,
-            TIME_SERIES_MODELS_DIR,
-            TEST_PIPELINE_OUTPUT,
-            TEST_PRECONFIGURED_MODELS
-        ]
-        for path in result_dirs:
-            if os.path.exists(path):
-                shutil.rmtree(path)
-
-    delete_test_results()
-    yield
-    delete_test_results()
-
-
-def test_source_tree_1_create_snapshot_pipeline_template(smart_ds_substations, cleanup):
-    cmd = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--with-loadshape -d1 "
-        f"--template-file {TEST_TEMPLATE_FILE} "
-    )
-    ret = ret = run_command(cmd)
+MAKE_PIPELINE_CONFIG_ARGS = shlex.split(f"{TEST_TEMPLATE_FILE} -c {TEST_PIPELINE_CONFIG_FILE}")
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """Run each test in its own directory so that generated files are isolated."""
+    monkeypatch.chdir(tmp_path)
+    # Templates in tmp_path are used once, so don't cache them in the user's home.
+    monkeypatch.setenv(TEMPLATE_CACHE_DISABLE_ENV, "1")
+
+
+@pytest.fixture(scope="session")
+def hpc_config(tmp_path_factory):
+    """The path to an HPC config file generated once for all tests"""
+    path = tmp_path_factory.mktemp("hpc") / TEST_HPC_CONFIG_FILE
+    ret = run_command(f"jade config hpc -a testaccount -p short -t local -w 4:00 -c {path}")
     assert ret == 0
+    return str(path)
 
-    assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
 
-    assert "model" in data
-    assert "prescreen" not in data
-    assert "simulation" in data
-    assert "postprocess" not in data
+def invoke_command(command, args):
+    """Run a click command in this process and return its exit code."""
+    result = CliRunner().invoke(command, args)
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        raise result.exception
+    return result.exit_code
 
-    assert data["inputs"] == smart_ds_substations
-    assert data["simulation_type"] == "snapshot"
 
-    assert "transform-params" in data["model"]
-    assert "config-params" in data["simulation"]
-    assert "submitter-params" in data["simulation"]
+def run_create_pipeline_template(args):
+    """Run 'disco create-pipeline template' in this process and return its exit code."""
+    return invoke_command(create_pipeline_template_cmd, shlex.split(args))
 
 
-def test_source_tree_1_create_snapshot_pipeline_template__impact_analysis(smart_ds_substations, cleanup):
-    cmd = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--with-loadshape --impact-analysis -d1 "
-        f"--template-file {TEST_TEMPLATE_FILE}"
-    )
-    ret = ret = run_command(cmd)
-    assert ret == 0
+def run_create_pipeline_config():
+    """Run 'disco create-pipeline config' on the test template in this process."""
+    return invoke_command(create_pipeline_config_cmd, MAKE_PIPELINE_CONFIG_ARGS)
 
-    assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
 
-    assert "model" in data
-    assert "prescreen" not in data
-    assert "simulation" in data
-    assert "postprocess" in data
+def assert_files(directory, names):
+    """Check that all names exist in directory with a single directory listing."""
+    missing = set(names) - set(os.listdir(directory))
+    assert not missing, f"missing from {directory}: {sorted(missing)}"
 
-    assert data["inputs"] == smart_ds_substations
-    assert data["simulation_type"] == "snapshot"
-    assert data["analysis_type"] == "impact-analysis"
 
-    assert "transform-params" in data["model"]
+def check_template_sections(data, expected_sections):
+    """Check that a pipeline template contains exactly the expected sections."""
+    for section in ("model", "prescreen", "simulation", "postprocess"):
+        assert (section in data) == (section in expected_sections), section
 
-    assert "config-params" in data["simulation"]
+    if "model" in expected_sections:
+        assert "transform-params" in data["model"]
+
+    if "prescreen" in expected_sections:
+        assert "config-params" in data["prescreen"]
+        assert "prescreen-params" in data["prescreen"]
+        assert "submitter-params" in data["prescreen"]
+        assert "config-params" not in data["simulation"]
+    else:
+        assert "config-params" in data["simulation"]
     assert "submitter-params" in data["simulation"]
 
-    assert "config-params" in data["postprocess"]
-    assert "submitter-params" in data["postprocess"]
+    if "postprocess" in expected_sections:
+        assert "config-params" in data["postprocess"]
+        assert "submitter-params" in data["postprocess"]
 
 
-def test_source_tree_1_create_snapshot_pipeline_template__prescreen(smart_ds_substations, cleanup):
+@pytest.mark.parametrize(
+    "flags, expected_sections, analysis_type",
+    [
+        ("--with-loadshape -d1", {"model", "simulation"}, "none"),
+        ("--with-loadshape --impact-analysis -d1", {"model", "simulation", "postprocess"}, "impact-analysis"),
+        # --prescreen has no effect on snapshot pipelines.
+        ("--with-loadshape --prescreen -d1", {"model", "simulation"}, "none"),
+    ],
+    ids=["default", "impact_analysis", "prescreen"],
+)
+def test_source_tree_1_create_snapshot_pipeline_template(
+    smart_ds_substations, flags, expected_sections, analysis_type
+):
     cmd = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--with-loadshape --prescreen -d1 "
+        f"{smart_ds_substations} "
+        f"--task-name TestTask {flags} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd)
+    ret = run_create_pipeline_template(cmd)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
     data = load_data(TEST_TEMPLATE_FILE)
-    assert "prescreen" not in data
-
+    assert data["inputs"] == smart_ds_substations
+    assert data["simulation_type"] == "snapshot"
+    assert data["analysis_type"] == analysis_type
+    check_template_sections(data, expected_sections)
 
-def test_source_tree_1_create_snapshot_pipeline_template__preconfigured_models(smart_ds_substations, cleanup):
-    cmd1 = f"disco transform-model {smart_ds_substations} snapshot -o {TEST_PRECONFIGURED_MODELS}"
-    ret = run_command(cmd1)
-    assert ret == 0
-    assert os.path.exists(TEST_PRECONFIGURED_MODELS)
 
+def test_source_tree_1_create_snapshot_pipeline_template__preconfigured_models(preconfigured_snapshot_models):
     cmd = (
-        f"disco create-pipeline template {TEST_PRECONFIGURED_MODELS} "
+        f"{preconfigured_snapshot_models} "
         "--task-name TestTask "
         "--preconfigured --with-loadshape -d1 "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd)
+    ret = run_create_pipeline_template(cmd)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
@@ -190,27 +164,22 @@ def test_source_tree_1_create_snapshot_pipeline_template__preconfigured_models(s
     assert data["preconfigured"] == True
 
 
-def test_source_tree_1_config_snapshot_pipeline(smart_ds_substations, cleanup):
+def test_source_tree_1_config_snapshot_pipeline(smart_ds_substations, hpc_config):
     cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
+        f"{smart_ds_substations} "
         "--task-name TestTask "
         "--with-loadshape -d1 "
+        f"--hpc-config {hpc_config} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
+    ret = run_create_pipeline_template(cmd1)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
 
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
+    ret = run_create_pipeline_config()
     assert ret == 0
 
-    assert os.path.exists(TEST_HPC_CONFIG_FILE)
     assert os.path.exists(TEST_PIPELINE_CONFIG_FILE)
     assert not os.path.exists(PRESCREEN_AUTO_CONFIG_TEXT_FILE)
     assert os.path.exists(SIMULATION_AUTO_CONFIG_TEXT_FILE)
@@ -220,28 +189,22 @@ def test_source_tree_1_config_snapshot_pipeline(smart_ds_substations, cleanup):
     assert len(pipeline_data["stages"]) == 1
 
 
-def test_source_tree_1_config_snapshot_pipeline__impact_analysis(smart_ds_substations, cleanup):
+def test_source_tree_1_config_snapshot_pipeline__impact_analysis(smart_ds_substations, hpc_config):
     cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
+        f"{smart_ds_substations} "
         "--task-name TestTask "
         "--impact-analysis --with-loadshape -d1 "
+        f"--hpc-config {hpc_config} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
+    ret = run_create_pipeline_template(cmd1)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["postprocess"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
 
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
+    ret = run_create_pipeline_config()
     assert ret == 0
 
-    assert os.path.exists(TEST_HPC_CONFIG_FILE)
     assert os.path.exists(TEST_TEMPLATE_FILE)
     assert os.path.exists(TEST_PIPELINE_CONFIG_FILE)
     assert not os.path.exists(PRESCREEN_AUTO_CONFIG_TEXT_FILE)
@@ -253,149 +216,54 @@ def test_source_tree_1_config_snapshot_pipeline__impact_analysis(smart_ds_substa
     assert len(pipeline_data["stages"]) == 2
 
 
-def test_source_tree_1_create_time_series_pipeline_template(smart_ds_substations, cleanup):
-    cmd = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--simulation-type time-series "
-        f"--template-file {TEST_TEMPLATE_FILE}"
-    )
-    ret = run_command(cmd)
-    assert ret == 0
-
-    assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-
-    assert "model" in data
-    assert "prescreen" not in data
-    assert "simulation" in data
-    assert "postprocess" not in data
-
-    assert data["inputs"] == smart_ds_substations
-    assert data["simulation_type"] == "time-series"
-
-    assert "transform-params" in data["model"]
-    assert "config-params" in data["simulation"]
-    assert "submitter-params" in data["simulation"]
-
-
-def test_source_tree_1_create_time_series_pipeline_template__impact_analysis(smart_ds_substations, cleanup):
-    cmd = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--simulation-type time-series --impact-analysis "
-        f"--template-file {TEST_TEMPLATE_FILE}"
-    )
-    ret = run_command(cmd)
-    assert ret == 0
-
-    assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-
-    assert "model" in data
-    assert "prescreen" not in data
-    assert "simulation" in data
-    assert "postprocess" in data
-
-    assert data["inputs"] == smart_ds_substations
-    assert data["simulation_type"] == "time-series"
-    assert data["analysis_type"] == "impact-analysis"
-
-    assert "transform-params" in data["model"]
-
-    assert "config-params" in data["simulation"]
-    assert "submitter-params" in data["simulation"]
-
-    assert "config-params" in data["postprocess"]
-    assert "submitter-params" in data["postprocess"]
-
-
-def test_source_tree_1_create_time_series_pipeline_template__prescreen(smart_ds_substations, cleanup):
-    cmd = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--simulation-type time-series --prescreen "
-        f"--template-file {TEST_TEMPLATE_FILE}"
-    )
-    ret = run_command(cmd)
-    assert ret == 0
-
-    assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-
-    assert "model" in data
-    assert "prescreen" in data
-    assert "simulation" in data
-    assert "postprocess" not in data
-
-    assert data["inputs"] == smart_ds_substations
-    assert data["simulation_type"] == "time-series"
-
-    assert "transform-params" in data["model"]
-
-    assert "config-params" in data["prescreen"]
-    assert "prescreen-params" in data["prescreen"]
-    assert "submitter-params" in data["prescreen"]
-
-    assert "config-params" not in data["simulation"]
-    assert "submitter-params" in data["simulation"]
-
-
-def test_source_tree_1_create_time_series_pipeline_template__prescreen__impact_analysis(smart_ds_substations, cleanup):
+@pytest.mark.parametrize(
+    "flags, expected_sections, analysis_type",
+    [
+        ("", {"model", "simulation"}, "none"),
+        ("--impact-analysis", {"model", "simulation", "postprocess"}, "impact-analysis"),
+        ("--prescreen", {"model", "prescreen", "simulation"}, "none"),
+        (
+            "--prescreen --impact-analysis",
+            {"model", "prescreen", "simulation", "postprocess"},
+            "impact-analysis",
+        ),
+    ],
+    ids=["default", "impact_analysis", "prescreen", "prescreen__impact_analysis"],
+)
+def test_source_tree_1_create_time_series_pipeline_template(
+    smart_ds_substations, flags, expected_sections, analysis_type
+):
     cmd = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--simulation-type  time-series --prescreen --impact-analysis "
+        f"{smart_ds_substations} "
+        f"--task-name TestTask --simulation-type time-series {flags} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd)
+    ret = run_create_pipeline_template(cmd)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
     data = load_data(TEST_TEMPLATE_FILE)
-
-    assert "model" in data
-    assert "prescreen" in data
-    assert "simulation" in data
-    assert "postprocess" in data
-
     assert data["inputs"] == smart_ds_substations
     assert data["simulation_type"] == "time-series"
-    assert data["analysis_type"] == "impact-analysis"
-
-    assert "transform-params" in data["model"]
+    assert data["analysis_type"] == analysis_type
+    check_template_sections(data, expected_sections)
 
-    assert "config-params" in data["prescreen"]
-    assert "prescreen-params" in data["prescreen"]
-    assert "submitter-params" in data["prescreen"]
 
-    assert "config-params" not in data["simulation"]
-    assert "submitter-params" in data["simulation"]
-
-    assert "config-params" in data["postprocess"]
-    assert "submitter-params" in data["postprocess"]
-
-
-def test_source_tree_1_config_time_series_pipeline(smart_ds_substations, cleanup):
+def test_source_tree_1_config_time_series_pipeline(smart_ds_substations, hpc_config):
     cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
+        f"{smart_ds_substations} "
         "--task-name TestTask "
         "--simulation-type time-series "
+        f"--hpc-config {hpc_config} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
+    ret = run_create_pipeline_template(cmd1)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
 
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
+    ret = run_create_pipeline_config()
 
-    assert os.path.exists(TEST_HPC_CONFIG_FILE)
     assert os.path.exists(TEST_PIPELINE_CONFIG_FILE)
     assert not os.path.exists(PRESCREEN_AUTO_CONFIG_TEXT_FILE)
     assert os.path.exists(SIMULATION_AUTO_CONFIG_TEXT_FILE)
@@ -405,14 +273,14 @@ def test_source_tree_1_config_time_series_pipeline(smart_ds_substations, cleanup
     assert len(pipeline_data["stages"]) == 1
 
 
-def test_source_tree_1_config_time_series_pipeline__singularity(smart_ds_substations, cleanup):
+def test_source_tree_1_config_time_series_pipeline__singularity(smart_ds_substations):
     cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
+        f"{smart_ds_substations} "
         "--task-name TestTask "
         "--simulation-type time-series -p -h "
         f"--template-file {TEST_TEMPLATE_FILE} -S -C ."  # It's OK that this is not a container.
     )
-    ret = run_command(cmd1)
+    ret = run_create_pipeline_template(cmd1)
     assert ret == 0
     assert os.path.exists(TEST_TEMPLATE_FILE)
     data = load_data(TEST_TEMPLATE_FILE)
@@ -421,28 +289,22 @@ def test_source_tree_1_config_time_series_pipeline__singularity(smart_ds_substat
     assert data["postprocess"]["submitter-params"]["singularity_params"]["enabled"]
 
 
-def test_source_tree_1_config_time_series_pipeline__prescreen(smart_ds_substations, cleanup):
+def test_source_tree_1_config_time_series_pipeline__prescreen(smart_ds_substations, hpc_config):
     cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
+        f"{smart_ds_substations} "
         "--task-name TestTask "
         "--simulation-type time-series --prescreen "
+        f"--hpc-config {hpc_config} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
+    ret = run_create_pipeline_template(cmd1)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["prescreen"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
 
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
+    ret = run_create_pipeline_config()
     assert ret == 0
 
-    assert os.path.exists(TEST_HPC_CONFIG_FILE)
     assert os.path.exists(TEST_PIPELINE_CONFIG_FILE)
     assert os.path.exists(PRESCREEN_AUTO_CONFIG_TEXT_FILE)
     assert os.path.exists(SIMULATION_AUTO_CONFIG_TEXT_FILE)
@@ -452,28 +314,22 @@ def test_source_tree_1_config_time_series_pipeline__prescreen(smart_ds_substatio
     assert len(pipeline_data["stages"]) == 2
 
 
-def test_source_tree_1_config_time_series_pipeline__impact_analysis(smart_ds_substations, cleanup):
+def test_source_tree_1_config_time_series_pipeline__impact_analysis(smart_ds_substations, hpc_config):
     cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
+        f"{smart_ds_substations} "
         "--task-name TestTask "
         "--simulation-type time-series --impact-analysis "
+        f"--hpc-config {hpc_config} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
+    ret = run_create_pipeline_template(cmd1)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["postprocess"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
 
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
+    ret = run_create_pipeline_config()
     assert ret == 0
 
-    assert os.path.exists(TEST_HPC_CONFIG_FILE)
     assert os.path.exists(TEST_PIPELINE_CONFIG_FILE)
     assert not os.path.exists(PRESCREEN_AUTO_CONFIG_TEXT_FILE)
     assert os.path.exists(SIMULATION_AUTO_CONFIG_TEXT_FILE)
@@ -483,29 +339,22 @@ def test_source_tree_1_config_time_series_pipeline__impact_analysis(smart_ds_sub
     assert len(pipeline_data["stages"]) == 2
 
 
-def test_source_tree_1_config_time_series_pipeline__prescreen__impact_analysis(smart_ds_substations, cleanup):
+def test_source_tree_1_config_time_series_pipeline__prescreen__impact_analysis(smart_ds_substations, hpc_config):
     cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
+        f"{smart_ds_substations} "
         "--task-name TestTask "
         "--simulation-type time-series --impact-analysis --prescreen "
+        f"--hpc-config {hpc_config} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
+    ret = run_create_pipeline_template(cmd1)
     assert ret == 0
 
     assert os.path.exists(TEST_TEMPLATE_FILE)
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["prescreen"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["postprocess"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
 
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
+    ret = run_create_pipeline_config()
     assert ret == 0
 
-    assert os.path.exists(TEST_HPC_CONFIG_FILE)
     assert os.path.exists(TEST_PIPELINE_CONFIG_FILE)
     assert os.path.exists(PRESCREEN_AUTO_CONFIG_TEXT_FILE)
     assert os.path.exists(SIMULATION_AUTO_CONFIG_TEXT_FILE)
@@ -515,112 +364,82 @@ def test_source_tree_1_config_time_series_pipeline__prescreen__impact_analysis(s
     assert len(pipeline_data["stages"]) == 3
 
 
-def test_source_tree_1_snapshot_pipeline_submit__hosting_capacity(smart_ds_substations, cleanup):
-    cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        f"--hosting-capacity --with-loadshape -d1 "
-        f"--template-file {TEST_TEMPLATE_FILE} "
-    )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
-    assert ret == 0
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["postprocess"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
-
-    cmd2 = f"jade pipeline submit {TEST_PIPELINE_CONFIG_FILE} -o {TEST_PIPELINE_OUTPUT}"
-    ret = run_command(cmd2)
-
-    assert ret == 0
-    assert not os.path.exists("snapshot-models")
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "snapshot-models"))
-
-    assert os.path.exists(TEST_PIPELINE_OUTPUT)
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1"))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2"))
-
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", FEEDER_HEAD_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", FEEDER_LOSSES_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", METADATA_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", THERMAL_METRICS_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", VOLTAGE_METRICS_TABLE))
-
-    modes = (x.value for x in SnapshotTimePointSelectionMode if x != SnapshotTimePointSelectionMode.NONE)
-    for mode in modes:
-        expected1 = SCENARIO_HOSTING_CAPACITY_OVERALL_FILE.replace(".json", f"__{mode}.json")
-        expected2 = SCENARIO_HOSTING_CAPACITY_SUMMARY_FILE.replace(".json", f"__{mode}.json")
-        assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", expected1))
-        assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", expected2))
-
+@pytest.fixture
+def submitted_pipeline(request, smart_ds_substations, hpc_config):
+    """Create and submit a pipeline with the template flags in request.param.
 
-def test_source_tree_1_time_series_pipeline_submit__prescreen__impact_analysis(smart_ds_substations, cleanup):
-    cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--simulation-type time-series --impact-analysis --prescreen "
+    Returns the pipeline output directory.
+    """
+    cmd = (
+        f"{smart_ds_substations} "
+        f"--task-name TestTask {request.param} "
+        f"--hpc-config {hpc_config} "
         f"--template-file {TEST_TEMPLATE_FILE}"
     )
-    ret = run_command(cmd1)
+    ret = run_create_pipeline_template(cmd)
     assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
+    ret = run_create_pipeline_config()
     assert ret == 0
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["prescreen"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["postprocess"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
-
-    cmd2 = f"jade pipeline submit {TEST_PIPELINE_CONFIG_FILE} -o {TEST_PIPELINE_OUTPUT}"
-    ret = run_command(cmd2)
-    assert not os.path.exists("time-series-models")
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "time-series-models"))
+
+    ret = run_command(f"jade pipeline submit {TEST_PIPELINE_CONFIG_FILE} -o {TEST_PIPELINE_OUTPUT}")
     assert ret == 0
+    return TEST_PIPELINE_OUTPUT
 
-    assert os.path.exists(TEST_PIPELINE_OUTPUT)
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1"))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2"))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage3"))
 
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2", FEEDER_HEAD_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2", FEEDER_LOSSES_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2", METADATA_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2", THERMAL_METRICS_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2", VOLTAGE_METRICS_TABLE))
+@pytest.mark.parametrize(
+    "submitted_pipeline", ["--hosting-capacity --with-loadshape -d1"], indirect=True
+)
+def test_source_tree_1_snapshot_pipeline_submit__hosting_capacity(submitted_pipeline):
+    assert not os.path.exists(SNAPSHOT_MODELS_DIR)
+    assert_files(submitted_pipeline, (SNAPSHOT_MODELS_DIR, "output-stage2"))
+
+    assert_files(
+        os.path.join(submitted_pipeline, "output-stage1"),
+        (
+            FEEDER_HEAD_TABLE,
+            FEEDER_LOSSES_TABLE,
+            METADATA_TABLE,
+            THERMAL_METRICS_TABLE,
+            VOLTAGE_METRICS_TABLE,
+            *_HC_EXPECTED,
+        ),
+    )
 
 
-def test_source_tree_1_time_series_pipeline_submit__cost_benefit(smart_ds_substations, cleanup):
-    cmd1 = (
-        f"disco create-pipeline template {smart_ds_substations} "
-        "--task-name TestTask "
-        "--simulation-type time-series --cost-benefit "
-        f"--template-file {TEST_TEMPLATE_FILE}"
+@pytest.mark.parametrize(
+    "submitted_pipeline",
+    ["--simulation-type time-series --impact-analysis --prescreen"],
+    indirect=True,
+)
+def test_source_tree_1_time_series_pipeline_submit__prescreen__impact_analysis(submitted_pipeline):
+    assert not os.path.exists(TIME_SERIES_MODELS_DIR)
+    assert_files(submitted_pipeline, (TIME_SERIES_MODELS_DIR, "output-stage1", "output-stage3"))
+
+    assert_files(
+        os.path.join(submitted_pipeline, "output-stage2"),
+        (
+            FEEDER_HEAD_TABLE,
+            FEEDER_LOSSES_TABLE,
+            METADATA_TABLE,
+            THERMAL_METRICS_TABLE,
+            VOLTAGE_METRICS_TABLE,
+        ),
     )
-    ret = run_command(cmd1)
-    assert ret == 0
-    ret = run_command(CONFIG_HPC_COMMAND)
-    assert ret == 0
-    data = load_data(TEST_TEMPLATE_FILE)
-    data["simulation"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    data["postprocess"]["submitter-params"]["hpc_config"] = TEST_HPC_CONFIG_FILE
-    dump_data(data, TEST_TEMPLATE_FILE)
-    ret = run_command(MAKE_PIPELINE_CONFIG_COMMAND)
-
-    cmd2 = f"jade pipeline submit {TEST_PIPELINE_CONFIG_FILE} -o {TEST_PIPELINE_OUTPUT}"
-    ret = run_command(cmd2)
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "time-series-models"))
-    assert ret == 0
 
-    assert os.path.exists(TEST_PIPELINE_OUTPUT)
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1"))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage2"))
 
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", CAPACITOR_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", REG_CONTROL_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", POWERS_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", LOAD_TYPES_TABLE))
-    assert os.path.exists(os.path.join(TEST_PIPELINE_OUTPUT, "output-stage1", PV_SYSTEM_TYPES_TABLE))
+@pytest.mark.parametrize(
+    "submitted_pipeline", ["--simulation-type time-series --cost-benefit"], indirect=True
+)
+def test_source_tree_1_time_series_pipeline_submit__cost_benefit(submitted_pipeline):
+    assert_files(submitted_pipeline, (TIME_SERIES_MODELS_DIR, "output-stage2"))
+
+    assert_files(
+        os.path.join(submitted_pipeline, "output-stage1"),
+        (
+            CAPACITOR_TABLE,
+            REG_CONTROL_TABLE,
+            POWERS_TABLE,
+            LOAD_TYPES_TABLE,
+            PV_SYSTEM_TYPES_TABLE,
+        ),
+    )
@@ -1,5 +1,6 @@
 from disco.exceptions import (
     EXCEPTIONS_TO_ERROR_CODES,
+    _ERROR_CODES_TO_EXCEPTIONS,
     OpenDssCompileError,
     OpenDssConvergenceError,
     PyDssConvergenceError,
@@ -27,3 +28,9 @@ def test_convergence_errors():
     assert is_convergence_error(get_error_code_from_exception(PyDssConvergenceError))
     assert is_convergence_error(get_error_code_from_exception(PyDssConvergenceErrorCountExceeded))
     assert is_convergence_error(get_error_code_from_exception(PyDssConvergenceMaxError))
+
+
+def test_error_codes_to_exceptions():
+    for exc in EXCEPTIONS_TO_ERROR_CODES:
+        assert _ERROR_CODES_TO_EXCEPTIONS[get_error_code_from_exception(exc)] is exc
+    assert 1 not in _ERROR_CODES_TO_EXCEPTIONS
@@ -0,0 +1,151 @@
+import os
+import pickle
+
+import pytest
+from jade.utils.utils import dump_data
+
+import disco.pipelines.base as base
+from disco.enums import SimulationType
+from disco.pipelines.base import PipelineTemplate, load_template_data
+from disco.pipelines.enums import TemplateSection, TemplateParams
+from disco.pipelines.utils import get_default_pipeline_template
+
+
+def test_get_command_params_does_not_modify_template():
+    template = get_default_pipeline_template(SimulationType.TIME_SERIES)
+    params = template.get_config_params(TemplateSection.SIMULATION)
+    assert params["exports_filename"] is None
+
+    data = template.data[TemplateSection.SIMULATION.value][TemplateParams.CONFIG_PARAMS.value]
+    assert data["exports_filename"] == "null"
+
+    params["verbose"] = True
+    assert template.get_config_params(TemplateSection.SIMULATION)["verbose"] is False
+
+
+def test_construct_options_string():
+    params = {
+        "config_file": "config.json",
+        "skip_night": True,
+        "verbose": False,
+        "num_processes": None,
+        "exports_filename": "null",
+        "resolution": 900,
+    }
+    options = PipelineTemplate._construct_options_string(params)
+    assert options == "--config-file=config.json --skip-night --resolution=900"
+
+
+def test_transform_output_is_not_prefixed_twice(monkeypatch):
+    monkeypatch.delenv("JADE_PIPELINE_OUTPUT_DIR", raising=False)
+    template = get_default_pipeline_template(SimulationType.TIME_SERIES)
+    expected = os.path.join("$JADE_PIPELINE_OUTPUT_DIR", "time-series-models")
+
+    options = template.get_transform_options(TemplateSection.MODEL)
+    assert f"--output={expected}" in options.split()
+    assert template.get_transform_options(TemplateSection.MODEL) == options
+    assert template.get_model_transform_output() == expected
+
+
+def test_command_options_reflect_template_changes():
+    template = get_default_pipeline_template(SimulationType.TIME_SERIES)
+    options = template.get_config_options(TemplateSection.SIMULATION)
+    assert "--verbose" not in options.split()
+
+    template.update_config_params({"verbose": True}, TemplateSection.SIMULATION)
+    assert "--verbose" in template.get_config_options(TemplateSection.SIMULATION).split()
+
+    params = template.data[TemplateSection.SIMULATION.value][TemplateParams.CONFIG_PARAMS.value]
+    params["verbose"] = False
+    assert "--verbose" not in template.get_config_options(TemplateSection.SIMULATION).split()
+
+
+@pytest.fixture
+def template_cache(tmp_path, monkeypatch):
+    """Point the template cache at a temporary directory"""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(base, "TEMPLATE_CACHE_DIR", cache_dir)
+    monkeypatch.delenv(base.TEMPLATE_CACHE_DISABLE_ENV, raising=False)
+    base._load_template_data.cache_clear()
+    yield cache_dir
+    base._load_template_data.cache_clear()
+
+
+def _make_template_file(path, task_name):
+    dump_data({"task_name": task_name}, path)
+    return str(path)
+
+
+def _fail_load_data(*args, **kwargs):
+    raise AssertionError("the template file was parsed")
+
+
+def test_template_cache_hit(template_cache, tmp_path, monkeypatch):
+    template_file = _make_template_file(tmp_path / "template.toml", "a")
+    assert load_template_data(template_file)["task_name"] == "a"
+    assert len(list(template_cache.glob("*.pkl"))) == 1
+
+    base._load_template_data.cache_clear()
+    monkeypatch.setattr(base, "load_data", _fail_load_data)
+    assert load_template_data(template_file)["task_name"] == "a"
+
+
+def test_template_cache_reloads_changed_file(template_cache, tmp_path):
+    template_file = _make_template_file(tmp_path / "template.toml", "a")
+    assert load_template_data(template_file)["task_name"] == "a"
+
+    stat = os.stat(template_file)
+    _make_template_file(template_file, "abc")
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    base._load_template_data.cache_clear()
+    assert load_template_data(template_file)["task_name"] == "abc"
+    assert len(list(template_cache.glob("*.pkl"))) == 1
+
+
+@pytest.mark.parametrize("clear_memory_cache", [False, True], ids=["memory", "disk"])
+def test_template_cache_reloads_same_size_and_mtime(template_cache, tmp_path, clear_memory_cache):
+    template_file = _make_template_file(tmp_path / "template.toml", "a")
+    assert load_template_data(template_file)["task_name"] == "a"
+
+    stat = os.stat(template_file)
+    _make_template_file(template_file, "b")
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    new_stat = os.stat(template_file)
+    assert (new_stat.st_size, new_stat.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+
+    if clear_memory_cache:
+        base._load_template_data.cache_clear()
+    assert load_template_data(template_file)["task_name"] == "b"
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"not a pickle", b"\x80\x09unsupported protocol", pickle.dumps({"data": {}})],
+    ids=["corrupt", "unsupported_protocol", "missing_keys"],
+)
+def test_template_cache_ignores_invalid_file(template_cache, tmp_path, contents):
+    template_file = _make_template_file(tmp_path / "template.toml", "a")
+    load_template_data(template_file)
+    cache_file, = template_cache.glob("*.pkl")
+    cache_file.write_bytes(contents)
+
+    base._load_template_data.cache_clear()
+    assert load_template_data(template_file)["task_name"] == "a"
+    with open(cache_file, "rb") as f:
+        assert pickle.load(f)["data"]["task_name"] == "a"
+
+
+def test_template_cache_is_bounded(template_cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "MAX_TEMPLATE_CACHE_FILES", 2)
+    for i in range(4):
+        load_template_data(_make_template_file(tmp_path / f"template{i}.toml", "a"))
+    assert len(list(template_cache.glob("*.pkl"))) == 2
+
+
+def test_template_cache_skips_packaged_and_disabled(template_cache, tmp_path, monkeypatch):
+    get_default_pipeline_template(SimulationType.TIME_SERIES)
+    assert not template_cache.exists()
+
+    monkeypatch.setenv(base.TEMPLATE_CACHE_DISABLE_ENV, "1")
+    load_template_data(_make_template_file(tmp_path / "template.toml", "a"))
+    assert not template_cache.exists()